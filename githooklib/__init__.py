@@ -1,4 +1,28 @@
-from .git_hook import *
-from .context import *
-from .command import *
-from .logger import *
+from typing import TYPE_CHECKING, Dict
+
+from .constants import VERSION as __version__
+from .utils.lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from .git_hook import *
+    from .context import *
+    from .command import *
+    from .logger import *
+
+_LAZY_EXPORTS: Dict[str, str] = {
+    "HookResult": ".git_hook",
+    "GitHook": ".git_hook",
+    "GitHookContext": ".context",
+    "CommandResult": ".command",
+    "CommandExecutor": ".command",
+    "CommandResultFactory": ".command",
+    "Logger": ".logger",
+    "get_logger": ".logger",
+    "TRACE": ".logger",
+    "SUCCESS": ".logger",
+}
+
+__getattr__, __dir__ = lazy_exports(globals(), _LAZY_EXPORTS)
+
+
+__all__ = ["__version__", *_LAZY_EXPORTS]
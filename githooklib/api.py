@@ -1,33 +1,64 @@
+from functools import cached_property
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional, Union
 
 from .logger import get_logger
-from .git_hook import GitHook
-from .gateways import ProjectRootGateway, GitGateway, SeedGateway
-from .services import (
-    HookDiscoveryService,
-    InstalledHooksContext,
-    HookManagementService,
-    ErrorMessageService,
-    HookSeedingService,
-    SeedFailureDetails,
-)
+
+if TYPE_CHECKING:
+    from .git_hook import GitHook
+    from .gateways import GitGateway, SeedGateway
+    from .services import (
+        HookDiscoveryService,
+        InstalledHooksContext,
+        HookManagementService,
+        ErrorMessageService,
+        HookSeedingService,
+        SeedFailureDetails,
+    )
 
 logger = get_logger()
 
 
 class API:
 
-    def __init__(self) -> None:
-        self.git_gateway = GitGateway()
-        self.hook_discovery_service = HookDiscoveryService()
-        self.hook_management_service = HookManagementService()
-        self.error_message_service = ErrorMessageService()
-        self.seed_service = HookSeedingService()
-        self.seed_gateway = SeedGateway()
+    @cached_property
+    def git_gateway(self) -> "GitGateway":
+        from .gateways import GitGateway
+
+        return GitGateway()
+
+    @cached_property
+    def hook_discovery_service(self) -> "HookDiscoveryService":
+        from .services import HookDiscoveryService
+
+        return HookDiscoveryService()
+
+    @cached_property
+    def hook_management_service(self) -> "HookManagementService":
+        from .services import HookManagementService
+
+        return HookManagementService(self.hook_discovery_service)
+
+    @cached_property
+    def error_message_service(self) -> "ErrorMessageService":
+        from .services import ErrorMessageService
 
-    def discover_all_hooks(self) -> dict[str, type[GitHook]]:
-        return self.hook_discovery_service.discover_hooks()
+        return ErrorMessageService(self.hook_discovery_service)
+
+    @cached_property
+    def seed_service(self) -> "HookSeedingService":
+        from .services import HookSeedingService
+
+        return HookSeedingService()
+
+    @cached_property
+    def seed_gateway(self) -> "SeedGateway":
+        from .gateways import SeedGateway
+
+        return SeedGateway()
+
+    def discover_all_hooks(self) -> dict[str, type["GitHook"]]:
+        return dict(self.hook_discovery_service.discover_hooks())
 
     def list_available_hook_names(self) -> list[str]:
         return self.hook_management_service.list_hooks()
@@ -44,13 +75,13 @@ class API:
     def run_hook_by_name(self, hook_name: str) -> int:
         return self.hook_management_service.run_hook(hook_name)
 
-    def get_installed_hooks_with_context(self) -> InstalledHooksContext:
+    def get_installed_hooks_with_context(self) -> "InstalledHooksContext":
         return self.hook_management_service.get_installed_hooks_with_context()
 
     def find_git_repository_root(self) -> Optional[Path]:
         return self.git_gateway.get_git_root_path()
 
-    def configure_hook_search_paths(self, *hook_paths: str) -> None:
+    def configure_hook_search_paths(self, *hook_paths: Union[str, Path]) -> None:
         self.hook_discovery_service.set_hook_search_paths(list(hook_paths))
 
     def get_hook_not_found_error_message(self, hook_name: str) -> str:
@@ -62,7 +93,9 @@ class API:
     def check_example_exists(self, example_name: str) -> bool:
         return self.seed_gateway.is_example_available(example_name)
 
-    def get_seed_failure_details(self, example_name: str) -> SeedFailureDetails:
+    def get_seed_failure_details(self, example_name: str) -> "SeedFailureDetails":
+        from .gateways import ProjectRootGateway
+
         try:
             project_root = ProjectRootGateway.find_project_root()
         except Exception:
@@ -70,6 +103,8 @@ class API:
         return self.seed_service.get_seed_failure_details(example_name, project_root)
 
     def seed_example_hook_to_project(self, example_name: str) -> bool:
+        from .gateways import ProjectRootGateway
+
         try:
             project_root = ProjectRootGateway.find_project_root()
         except Exception:
@@ -1,10 +1,14 @@
+import logging
+import os
 import sys
-from typing import Optional
+from typing import Any, Optional
 
-from .api import API
-from .constants import EXIT_SUCCESS, EXIT_FAILURE
-from .logger import get_logger
+from .constants import EXIT_SUCCESS, EXIT_FAILURE, VERSION
+from .logger import TRACE, get_logger
 from .ui_messages import (
+    UI_MESSAGE_HELP,
+    UI_MESSAGE_STARTUP_INFO,
+    UI_MESSAGE_COULD_NOT_FIND_PROJECT_ROOT,
     UI_MESSAGE_AVAILABLE_HOOKS_HEADER,
     UI_MESSAGE_NO_HOOKS_FOUND,
     UI_MESSAGE_INSTALLED_HOOKS_HEADER,
@@ -33,8 +37,11 @@ def print_error(message: str) -> None:
 
 
 class CLI:
+    __slots__ = ("_api",)
 
     def __init__(self) -> None:
+        from .api import API
+
         self._api = API()
 
     def list(self) -> None:
@@ -50,9 +57,9 @@ class CLI:
             logger.error(UI_MESSAGE_NO_HOOKS_FOUND)
             return
 
-        print(UI_MESSAGE_AVAILABLE_HOOKS_HEADER)
-        for hook_name in hook_names:
-            print(f"  - {hook_name}")
+        lines = [UI_MESSAGE_AVAILABLE_HOOKS_HEADER]
+        lines.extend(f"  - {hook_name}" for hook_name in hook_names)
+        print("\n".join(lines))
 
     def show(self) -> None:
         """Show all installed git hooks and their installation source."""
@@ -67,14 +74,15 @@ class CLI:
                 logger.error(UI_MESSAGE_NO_HOOKS_INSTALLED)
             return
 
-        print(UI_MESSAGE_INSTALLED_HOOKS_HEADER)
-        for hook_name, installed_via_tool in sorted(context.installed_hooks.items()):
+        lines = [UI_MESSAGE_INSTALLED_HOOKS_HEADER]
+        for hook_name, installed_via_tool in context.installed_hooks.items():
             source = (
                 UI_MESSAGE_HOOK_SOURCE_GITHOOKLIB
                 if installed_via_tool
                 else UI_MESSAGE_HOOK_SOURCE_EXTERNAL
             )
-            print(f"  - {hook_name} ({source})")
+            lines.append(f"  - {hook_name} ({source})")
+        print("\n".join(lines))
 
     def run(self, hook_name: str) -> int:
         """Run a hook manually for testing purposes.
@@ -86,10 +94,7 @@ class CLI:
             Exit code (0 for success, 1 for failure)
         """
         try:
-            if not self._api.check_hook_exists(hook_name):
-                error_msg = self._api.get_hook_not_found_error_message(hook_name)
-                print_error(error_msg)
-                logger.warning("Hook '%s' does not exist", hook_name)
+            if not self._require_hook(hook_name, ""):
                 return EXIT_FAILURE
             return self._api.run_hook_by_name(hook_name)
         except ValueError as e:
@@ -97,20 +102,24 @@ class CLI:
             print_error(str(e))
             return EXIT_FAILURE
 
-    def install(self, hook_name: str) -> int:
-        """Install a hook to .git/hooks/.
+    def install(self, hook_name: str, *hook_names: str) -> int:
+        """Install one or more hooks to .git/hooks/.
 
         Args:
             hook_name: Name of the hook to install
+            *hook_names: Names of further hooks to install in the same run
 
         Returns:
-            Exit code (0 for success, 1 for failure)
+            Exit code (0 if every hook was installed, 1 otherwise)
         """
+        results = [self._install(name) for name in (hook_name, *hook_names)]
+        if all(result == EXIT_SUCCESS for result in results):
+            return EXIT_SUCCESS
+        return EXIT_FAILURE
+
+    def _install(self, hook_name: str) -> int:
         try:
-            if not self._api.check_hook_exists(hook_name):
-                error_msg = self._api.get_hook_not_found_error_message(hook_name)
-                print_error(error_msg)
-                logger.warning("Hook '%s' does not exist, cannot install", hook_name)
+            if not self._require_hook(hook_name, ", cannot install"):
                 return EXIT_FAILURE
             success = self._api.install_hook_by_name(hook_name)
             if success:
@@ -123,20 +132,24 @@ class CLI:
             print_error(str(e))
             return EXIT_FAILURE
 
-    def uninstall(self, hook_name: str) -> int:
-        """Uninstall a hook from .git/hooks/.
+    def uninstall(self, hook_name: str, *hook_names: str) -> int:
+        """Uninstall one or more hooks from .git/hooks/.
 
         Args:
             hook_name: Name of the hook to uninstall
+            *hook_names: Names of further hooks to uninstall in the same run
 
         Returns:
-            Exit code (0 for success, 1 for failure)
+            Exit code (0 if every hook was uninstalled, 1 otherwise)
         """
+        results = [self._uninstall(name) for name in (hook_name, *hook_names)]
+        if all(result == EXIT_SUCCESS for result in results):
+            return EXIT_SUCCESS
+        return EXIT_FAILURE
+
+    def _uninstall(self, hook_name: str) -> int:
         try:
-            if not self._api.check_hook_exists(hook_name):
-                error_msg = self._api.get_hook_not_found_error_message(hook_name)
-                print_error(error_msg)
-                logger.warning("Hook '%s' does not exist, cannot uninstall", hook_name)
+            if not self._require_hook(hook_name, ", cannot uninstall"):
                 return EXIT_FAILURE
             success = self._api.uninstall_hook_by_name(hook_name)
             if success:
@@ -149,6 +162,13 @@ class CLI:
             print_error(str(e))
             return EXIT_FAILURE
 
+    def _require_hook(self, hook_name: str, reason: str) -> bool:
+        if self._api.check_hook_exists(hook_name):
+            return True
+        print_error(self._api.get_hook_not_found_error_message(hook_name))
+        logger.warning("Hook '%s' does not exist%s", hook_name, reason)
+        return False
+
     def seed(self, example_name: Optional[str] = None) -> int:
         """Seed an example hook from the examples folder to githooks/.
 
@@ -165,9 +185,9 @@ class CLI:
             if not available_examples:
                 logger.error(UI_MESSAGE_NO_EXAMPLE_HOOKS_AVAILABLE)
                 return EXIT_FAILURE
-            print(UI_MESSAGE_AVAILABLE_EXAMPLE_HOOKS_HEADER)
-            for example in available_examples:
-                print(f"  - {example}")
+            lines = [UI_MESSAGE_AVAILABLE_EXAMPLE_HOOKS_HEADER]
+            lines.extend(f"  - {example}" for example in available_examples)
+            print("\n".join(lines))
             return EXIT_SUCCESS
 
         try:
@@ -233,4 +253,106 @@ class CLI:
             return EXIT_FAILURE
 
 
-__all__ = ["CLI"]
+HELP_FLAGS = ("--help", "-h")
+VERSION_FLAGS = ("--version", "-V")
+LOGGING_FLAGS = ("--debug", "--trace")
+
+
+def _setup_logging() -> None:
+    if "--trace" in sys.argv:
+        logger.setLevel(TRACE)
+        sys.argv.remove("--trace")
+    elif "--debug" in sys.argv:
+        logger.setLevel(logging.DEBUG)
+        sys.argv.remove("--debug")
+    else:
+        logger.setLevel(logging.INFO)
+
+
+def _print_static_response() -> bool:
+    args = [arg for arg in sys.argv[1:] if arg not in LOGGING_FLAGS]
+    first_arg = args[0] if args else None
+    if first_arg in VERSION_FLAGS:
+        print(VERSION)
+        return True
+    if first_arg is None or first_arg in HELP_FLAGS:
+        print(UI_MESSAGE_HELP)
+        return True
+    return False
+
+
+def _parse_arguments(args: list[str]) -> tuple[list[str], dict[str, str]]:
+    positional: list[str] = []
+    keyword: dict[str, str] = {}
+    remaining = iter(args)
+    for arg in remaining:
+        if not arg.startswith("--"):
+            positional.append(arg)
+            continue
+        key, sep, value = arg[2:].partition("=")
+        if not sep:
+            value = next(remaining, "")
+        keyword[key.replace("-", "_")] = value
+    return positional, keyword
+
+
+def _dispatch(cli: Any, args: list[str]) -> int:
+    import inspect
+
+    if not args:
+        print(UI_MESSAGE_HELP)
+        return 0
+    command, *rest = args
+    handler = None if command.startswith("_") else getattr(cli, command, None)
+    if not callable(handler):
+        print(f"Unknown command '{command}'", file=sys.stderr)
+        print(UI_MESSAGE_HELP, file=sys.stderr)
+        return 2
+    if any(arg in HELP_FLAGS for arg in rest):
+        print(inspect.getdoc(handler) or "")
+        return 0
+    positional, keyword = _parse_arguments(rest)
+    try:
+        inspect.signature(handler).bind(*positional, **keyword)
+    except TypeError as e:
+        print(f"{command}: {e}", file=sys.stderr)
+        print(inspect.getdoc(handler) or "", file=sys.stderr)
+        return 2
+    code = handler(*positional, **keyword)
+    return code if isinstance(code, int) else 0
+
+
+def main_entry() -> None:
+    if _print_static_response():
+        return
+
+    if sys.platform != "win32":
+        os.environ["PAGER"] = "cat"
+        os.environ["INTERACTIVE"] = "False"
+
+    from .gateways import ProjectRootGateway
+
+    _setup_logging()
+    logger.info(UI_MESSAGE_STARTUP_INFO)
+    if logger.isEnabledFor(TRACE):
+        import platform
+
+        logger.trace("platform: %s", platform.platform())
+    logger.trace("interpreter: %s", sys.executable)
+    root = ProjectRootGateway.find_project_root()
+    if not root:
+        logger.error(UI_MESSAGE_COULD_NOT_FIND_PROJECT_ROOT)
+        sys.exit(1)
+    logger.debug("CWD: %s", root)
+    try:
+        code = _dispatch(CLI(), sys.argv[1:])
+    except Exception:  # pylint: disable=broad-except
+        sys.exit(1)
+    except KeyboardInterrupt:
+        logger.error("KeyboardInterrupt")
+        sys.exit(1)
+
+    sys.exit(code if isinstance(code, int) else 0)
+
+
+__all__ = ["CLI", "main_entry"]
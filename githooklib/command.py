@@ -1,3 +1,4 @@
+import logging
 import subprocess
 import sys
 from pathlib import Path
@@ -22,10 +23,10 @@ class CommandExecutor:
         shell: bool = False,
     ) -> CommandResult:
         cmd_list = self._normalize_command(command, shell)
-        normalized_cwd = self._normalize_cwd(cwd)
-        logger.debug("Running command: %s", " ".join(cmd_list))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Running command: %s", " ".join(cmd_list))
         result = self._execute_command(
-            cmd_list, normalized_cwd, capture_output, check, text, shell
+            cmd_list, cwd, capture_output, check, text, shell
         )
         return result
 
@@ -61,15 +62,10 @@ class CommandExecutor:
             return command.split() if not shell else [command]
         return command
 
-    def _normalize_cwd(self, cwd: Optional[Union[str, Path]]) -> Optional[Path]:
-        if cwd is None:
-            return None
-        return Path(cwd) if isinstance(cwd, str) else cwd
-
     def _execute_command(  # pylint: disable=too-many-positional-arguments
         self,
         cmd_list: List[str],
-        cwd: Optional[Path],
+        cwd: Optional[Union[str, Path]],
         capture_output: bool,
         check: bool,
         text: bool,
@@ -92,7 +88,7 @@ class CommandExecutor:
     def _run_subprocess(  # pylint: disable=too-many-positional-arguments
         self,
         cmd_list: List[str],
-        cwd: Optional[Path],
+        cwd: Optional[Union[str, Path]],
         capture_output: bool,
         check: bool,
         text: bool,
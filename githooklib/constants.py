@@ -1,5 +1,8 @@
-EXIT_SUCCESS: int = 0
-EXIT_FAILURE: int = 1
+from typing import Final
+
+VERSION: str = "1.0.0"
+EXIT_SUCCESS: Final[int] = 0
+EXIT_FAILURE: Final[int] = 1
 EXAMPLES_DIR: str = "examples"
 TARGET_HOOKS_DIR: str = "githooks"
 DEFAULT_HOOK_SEARCH_DIR = "githooks"
@@ -21,4 +24,4 @@ if __name__ == "__main__":
     main()
 """
 
-__all__ = ["EXIT_SUCCESS", "EXIT_FAILURE", "DELEGATOR_SCRIPT_TEMPLATE"]
+__all__ = ["VERSION", "EXIT_SUCCESS", "EXIT_FAILURE", "DELEGATOR_SCRIPT_TEMPLATE"]
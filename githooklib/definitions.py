@@ -6,6 +6,8 @@ from .constants import EXIT_SUCCESS, EXIT_FAILURE
 
 @dataclass
 class CommandResult:
+    __slots__ = ("success", "exit_code", "stdout", "stderr", "command")
+
     success: bool
     exit_code: int
     stdout: str
@@ -34,6 +36,14 @@ class HookResult:
 
 @dataclass
 class SeedFailureDetails:
+    __slots__ = (
+        "example_not_found",
+        "project_root_not_found",
+        "target_hook_already_exists",
+        "target_hook_path",
+        "available_examples",
+    )
+
     example_not_found: bool
     project_root_not_found: bool
     target_hook_already_exists: bool
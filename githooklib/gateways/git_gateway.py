@@ -1,70 +1,118 @@
-import subprocess
+import os
 from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Optional, Dict, Iterator, List, Tuple, Union
 
 from ..logger import get_logger
 
 logger = get_logger()
 
+_SKIP_SUFFIXES = (".sample", ".sample.new")
+_GIT_ROOT_CACHE: Dict[str, Optional[Path]] = {}
+
 
 class GitGateway:
+    HOOK_HEAD_SIZE = 4096
+
     @staticmethod
-    @lru_cache
     def get_git_root_path() -> Optional[Path]:
-        result = (
-            GitGateway._find_git_root_via_command()
-            or GitGateway._find_git_root_via_filesystem()
-        )
+        cwd = os.getcwd()
+        if cwd in _GIT_ROOT_CACHE:
+            return _GIT_ROOT_CACHE[cwd]
+        result = None
+        if "GIT_DIR" not in os.environ:
+            visited: List[str] = []
+            work_tree = GitGateway._find_git_root_via_filesystem(cwd, visited)
+            if work_tree:
+                result = work_tree / ".git"
+                _GIT_ROOT_CACHE.update(dict.fromkeys(visited, result))
+        if result is None:
+            result = GitGateway._find_git_root_via_command()
+        _GIT_ROOT_CACHE[cwd] = result
         logger.trace("git root: %s", result)
         return result
 
+    @staticmethod
+    def clear_git_root_cache() -> None:
+        _GIT_ROOT_CACHE.clear()
+
     @staticmethod
     def _find_git_root_via_command() -> Optional[Path]:
+        import subprocess
+
         try:
             result = subprocess.run(
                 ["git", "rev-parse", "--show-toplevel"],
+                stdin=subprocess.DEVNULL,
                 capture_output=True,
                 text=True,
                 check=True,
             )
-            git_root = Path(result.stdout.strip()).resolve()
-            if (git_root / ".git").exists():
-                git_dir = git_root / ".git"
-                return git_dir
+            git_dir = os.path.join(result.stdout.strip(), ".git")
+            if os.path.exists(git_dir):
+                return Path(git_dir)
             return None
         except (subprocess.CalledProcessError, FileNotFoundError) as e:
             return None
 
     @staticmethod
-    def _find_git_root_via_filesystem() -> Optional[Path]:
-        current = Path.cwd()
-        for path in [current] + list(current.parents):
-            if (path / ".git").exists():
-                resolved = path.resolve()
-                return resolved
-        return None
-
-    @lru_cache
+    def _find_git_root_via_filesystem(
+        cwd: Optional[str] = None, visited: Optional[List[str]] = None
+    ) -> Optional[Path]:
+        current = cwd or os.getcwd()
+        if visited is not None:
+            visited.append(current)
+        while not os.path.exists(os.path.join(current, ".git")):
+            parent = os.path.dirname(current)
+            if parent == current:
+                return None
+            current = parent
+            if visited is not None:
+                visited.append(current)
+        return Path(current).resolve()
+
     def get_installed_hooks(self, hooks_dir: Path) -> Dict[str, bool]:
-        installed = {}
-        for hook_file in hooks_dir.iterdir():
-            if hook_file.is_file() and not hook_file.name.endswith(".sample"):
-                hook_name = hook_file.name
-                is_tool_installed = self._is_hook_from_githooklib(hook_file)
-                installed[hook_name] = is_tool_installed
-        return installed
+        return dict(sorted(self.iter_installed_hooks(hooks_dir)))
+
+    def iter_installed_hooks(self, hooks_dir: Path) -> Iterator[Tuple[str, bool]]:
+        with os.scandir(hooks_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(_SKIP_SUFFIXES) or not entry.is_file():
+                    continue
+                yield self._install_status_for(entry)
 
     @staticmethod
-    def _is_hook_from_githooklib(hook_path: Path) -> bool:
+    def _install_status_for(entry: "os.DirEntry[str]") -> Tuple[str, bool]:
         try:
-            content = hook_path.read_text()
-            has_delegation_pattern = (
-                "-m" in content and "githooklib" in content and "run" in content
-            )
-            return has_delegation_pattern
-        except (OSError, IOError, UnicodeDecodeError) as e:
+            stat = entry.stat()
+        except OSError:
+            return entry.name, False
+        return entry.name, GitGateway._classify_hook(
+            entry.path, stat.st_mtime_ns, stat.st_size
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _classify_hook(
+        hook_path: str, mtime_ns: int, size: int  # pylint: disable=unused-argument
+    ) -> bool:
+        return GitGateway._is_hook_from_githooklib(hook_path)
+
+    @staticmethod
+    def _is_hook_from_githooklib(hook_path: Union[str, Path]) -> bool:
+        try:
+            head = GitGateway._read_head(hook_path)
+        except OSError:
             return False
+        return b"githooklib" in head and b"-m" in head and b"run" in head
+
+    @staticmethod
+    def _read_head(hook_path: Union[str, Path]) -> bytes:
+        fd = os.open(hook_path, os.O_RDONLY)
+        try:
+            return os.read(fd, GitGateway.HOOK_HEAD_SIZE)
+        finally:
+            os.close(fd)
 
 
 __all__ = ["GitGateway"]
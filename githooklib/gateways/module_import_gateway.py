@@ -1,4 +1,7 @@
+import importlib.util
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -9,26 +12,33 @@ logger = get_logger()
 
 class ModuleImportGateway:
     @staticmethod
-    def find_module_file(
-        module_name: str, project_root: Optional[Path]
-    ) -> Optional[str]:
-        try:
-            import importlib.util
+    @lru_cache(maxsize=256)
+    def _resolve_path(path: str) -> Path:
+        return Path(path).resolve()
 
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _find_module_origin(module_name: str) -> Optional[str]:
+        try:
             spec = importlib.util.find_spec(module_name)
-            if spec and spec.origin:
-                if project_root:
-                    try:
-                        module_path = Path(spec.origin)
-                        relative_path = module_path.relative_to(project_root)
-                        return str(relative_path)
-                    except ValueError:
-                        return spec.origin
-                return spec.origin
-        except (ImportError, AttributeError, ValueError) as e:
-            pass
+        except (ImportError, AttributeError, ValueError):
+            return None
+        if spec and spec.origin:
+            return spec.origin
         return None
 
+    @staticmethod
+    def find_module_file(
+        module_name: str, project_root: Optional[Path]
+    ) -> Optional[str]:
+        origin = ModuleImportGateway._find_module_origin(module_name)
+        if origin and project_root:
+            try:
+                return str(Path(origin).relative_to(project_root))
+            except ValueError:
+                return origin
+        return origin
+
     @staticmethod
     def convert_module_name_to_file_path(module_name: str) -> Path:
         module_path_parts = module_name.split(".")
@@ -36,12 +46,13 @@ class ModuleImportGateway:
 
     @staticmethod
     def _add_to_sys_path_if_needed(directory: Path) -> None:
-        if str(directory) not in sys.path:
-            sys.path.insert(0, str(directory))
+        directory_str = os.fspath(directory)
+        if directory_str not in sys.path:
+            sys.path.insert(0, directory_str)
 
     def import_module(self, module_path: Path, base_dir: Path) -> None:
         logger.trace("Importing module: %s", module_path)
-        module_path = module_path.resolve()
+        module_path = self._resolve_path(str(module_path.parent)) / module_path.name
         try:
             relative_path = module_path.relative_to(base_dir)
             self._import_relative_module(relative_path, base_dir)
@@ -51,14 +62,33 @@ class ModuleImportGateway:
     def _import_relative_module(self, relative_path: Path, base_dir: Path) -> None:
         parts = relative_path.parts[:-1] + (relative_path.stem,)
         module_name = ".".join(parts)
+        if self._is_already_imported(module_name):
+            return
         self._add_to_sys_path_if_needed(base_dir)
         __import__(module_name)
 
     def _import_absolute_module(self, module_path: Path) -> None:
-        parent_dir = module_path.parent.resolve()
         module_name = module_path.stem
-        self._add_to_sys_path_if_needed(parent_dir)
-        __import__(module_name)
+        if self._is_already_imported(module_name):
+            return
+        spec = importlib.util.spec_from_file_location(module_name, module_path)
+        if spec is None or spec.loader is None:
+            raise ImportError(f"Cannot load module from {module_path}")
+        module = importlib.util.module_from_spec(spec)
+        self._add_to_sys_path_if_needed(module_path.parent)
+        sys.modules[module_name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[module_name]
+            raise
+
+    @staticmethod
+    def _is_already_imported(module_name: str) -> bool:
+        if module_name in sys.modules:
+            logger.trace("Module already imported: %s", module_name)
+            return True
+        return False
 
 
 __all__ = ["ModuleImportGateway"]
@@ -1,4 +1,3 @@
-from functools import lru_cache
 from pathlib import Path
 
 from ..exceptions import GitHookLibException
@@ -11,7 +10,6 @@ logger = get_logger()
 
 class ProjectRootGateway:
     @staticmethod
-    @lru_cache
     def find_project_root() -> Path:
         git = GitGateway.get_git_root_path()
         if not git:
@@ -1,3 +1,4 @@
+import os
 from functools import lru_cache
 from pathlib import Path
 from typing import List
@@ -16,19 +17,22 @@ class SeedGateway:
     @lru_cache
     def get_available_examples(self) -> List[str]:
         examples_path = self._get_examples_folder_path()
-        if not examples_path.exists():
+        try:
+            with os.scandir(examples_path) as entries:
+                example_files = [
+                    entry.name[:-3]
+                    for entry in entries
+                    if entry.name.endswith(".py")
+                    and entry.name != "__init__.py"
+                    and entry.is_file()
+                ]
+        except (FileNotFoundError, NotADirectoryError):
             return []
-
-        example_files = [
-            f.stem for f in examples_path.glob("*.py") if f.name != "__init__.py"
-        ]
         return sorted(example_files)
 
     @lru_cache
     def is_example_available(self, example_name: str) -> bool:
-        examples_path = self._get_examples_folder_path()
-        source_file = examples_path / f"{example_name}.py"
-        return source_file.exists()
+        return example_name in self.get_available_examples()
 
     @lru_cache
     def get_example_path(self, example_name: str) -> Path:
@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List, Type, Tuple
-import traceback
+from typing import Dict, Optional, Type, Tuple
+import os
 import logging
+import string
 import sys
 from pathlib import Path
 
@@ -9,40 +10,62 @@ from .constants import DELEGATOR_SCRIPT_TEMPLATE, EXIT_SUCCESS, EXIT_FAILURE
 from .context import GitHookContext
 from .command import CommandExecutor
 from .logger import get_logger, Logger
-from .gateways import GitGateway, ModuleImportGateway, ProjectRootGateway
+from .gateways import GitGateway, ProjectRootGateway
 from .definitions import HookResult
 
+_DELEGATOR_SCRIPT_PARTS: Tuple[Tuple[str, Optional[str]], ...] = tuple(
+    (literal, field_name)
+    for literal, field_name, _, _ in string.Formatter().parse(DELEGATOR_SCRIPT_TEMPLATE)
+)
+
+
+class _HookLogger:
+    def __init__(self) -> None:
+        self._loggers: Dict[Type["GitHook"], Logger] = {}
+
+    def __get__(self, instance: Optional["GitHook"], owner: Type["GitHook"]) -> Logger:
+        logger = self._loggers.get(owner)
+        if logger is None:
+            logger = get_logger(
+                f"{owner.__module__}.{owner.__qualname__}", owner.get_hook_name()
+            )
+            self._loggers[owner] = logger
+        return logger
+
 
 class GitHook(ABC):
-    logger: Logger
-    _registered_hooks: List[Type["GitHook"]] = []
+    logger = _HookLogger()
+    _registered_hooks: Tuple[Type["GitHook"], ...] = ()
 
     @staticmethod
     def _write_script_file(hook_script_path: Path, script_content: str) -> None:
-        hook_script_path.write_text(script_content)
-
-    @staticmethod
-    def _make_script_executable(hook_script_path: Path) -> None:
-        hook_script_path.chmod(0o755)
+        fd = os.open(hook_script_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o755)
+        with os.fdopen(fd, "wb") as script_file:
+            script_file.write(script_content.encode("utf-8"))
+        # The open() mode is filtered by the umask and ignored for existing files.
+        os.chmod(hook_script_path, 0o755)
 
     def _generate_delegator_script(self) -> str:
         project_root = str(ProjectRootGateway.find_project_root())
         python_executable = sys.executable
-        return DELEGATOR_SCRIPT_TEMPLATE.format(
-            hook_name=self.get_hook_name(),
-            project_root=project_root.replace("\\", "\\\\"),
-            python_executable=python_executable.replace("\\", "\\\\"),
+        values = {
+            "hook_name": self.get_hook_name(),
+            "project_root": project_root.replace("\\", "\\\\"),
+            "python_executable": python_executable.replace("\\", "\\\\"),
+        }
+        return "".join(
+            literal + (values[field_name] if field_name else "")
+            for literal, field_name in _DELEGATOR_SCRIPT_PARTS
         )
 
     @classmethod
     def __init_subclass__(cls, **kwargs) -> None:
         super().__init_subclass__(**kwargs)
-        GitHook._registered_hooks.append(cls)
-        cls.logger = get_logger(__name__, cls.get_hook_name())
+        GitHook._registered_hooks = (*GitHook._registered_hooks, cls)
 
     @classmethod
-    def get_registered_hooks(cls) -> List[Type["GitHook"]]:
-        return cls._registered_hooks.copy()
+    def get_registered_hooks(cls) -> Tuple[Type["GitHook"], ...]:
+        return cls._registered_hooks
 
     @classmethod
     def _get_module_and_class(cls) -> Tuple[str, str]:
@@ -75,8 +98,7 @@ class GitHook(ABC):
             return EXIT_FAILURE
 
     def _handle_error(self, error: Exception) -> None:
-        self.logger.error("Unexpected error in hook: %s", error)
-        self.logger.error(traceback.format_exc())
+        self.logger.exception("Unexpected error in hook: %s", error)
 
     def install(self) -> bool:
         hooks_dir = self._validate_installation_prerequisites()
@@ -98,7 +120,7 @@ class GitHook(ABC):
             self.logger.error("Not a git repository")
             return None
         hooks_dir = git_root / "hooks"
-        if not hooks_dir.exists():
+        if not os.path.isdir(hooks_dir):
             self.logger.error("Hooks directory not found: %s", hooks_dir)
             return None
         return hooks_dir
@@ -109,42 +131,22 @@ class GitHook(ABC):
             self.logger.error("Not a git repository")
             return False
         hook_script_path = git_root / "hooks" / self.get_hook_name()
-        if not hook_script_path.exists():
-            self.logger.warning("Hook script not found: %s", hook_script_path)
-            return False
         try:
             hook_script_path.unlink()
             self.logger.success("Uninstalled hook: %s", self.get_hook_name())
             return True
+        except FileNotFoundError:
+            self.logger.warning("Hook script not found: %s", hook_script_path)
+            return False
         except Exception as e:  # pylint: disable=broad-exception-caught
             self.logger.error("Failed to uninstall hook: %s", e)
             return False
 
-    def _log_project_root_not_found(self, module_name: str) -> None:
-        module_file_path = ModuleImportGateway.convert_module_name_to_file_path(
-            module_name
-        )
-        current = Path.cwd()
-        searched_paths = [current] + list(current.parents)
-        full_module_path = current.resolve() / module_file_path
-        searched_dirs = ", ".join(str(p.resolve()) for p in searched_paths)
-        self.logger.error(
-            "Could not find project root containing %s. "
-            "Checked for module file at: %s "
-            "(resolved from CWD: %s). "
-            "Searched in directories: %s",
-            module_name,
-            full_module_path,
-            current.resolve(),
-            searched_dirs,
-        )
-
     def _write_hook_delegation_script(
         self, hook_script_path: Path, script_content: str
     ) -> bool:
         try:
             self._write_script_file(hook_script_path, script_content)
-            self._make_script_executable(hook_script_path)
             return True
         except Exception as e:  # pylint: disable=broad-exception-caught
             self.logger.error("Failed to install hook: %s", e)
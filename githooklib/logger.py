@@ -1,7 +1,8 @@
 import logging
 import sys
+from functools import lru_cache
 from types import FrameType
-from typing import IO, Optional, Union, Dict
+from typing import IO, Callable, Optional, Union, Dict
 import os
 
 TRACE = 5
@@ -66,6 +67,15 @@ def _get_root_logger() -> logging.Logger:
     return root_logger
 
 
+@lru_cache(maxsize=None)
+def _get_tqdm_write() -> Optional[Callable[..., None]]:
+    try:
+        from tqdm import tqdm
+    except ImportError:
+        return None
+    return tqdm.write
+
+
 class StreamRouter(logging.Handler):
     def __init__(self, stdout: IO, stderr: IO) -> None:
         super().__init__()
@@ -92,20 +102,18 @@ class StreamRouter(logging.Handler):
         return record.levelno >= logging.ERROR
 
     def _write_to_stderr(self, msg: str) -> None:
-        try:
-            from tqdm import tqdm
-
-            tqdm.write(msg, end="")
-        except ImportError:
+        tqdm_write = _get_tqdm_write()
+        if tqdm_write is not None:
+            tqdm_write(msg, end="")
+        else:
             self.stderr.write(msg)
             self.stderr.flush()
 
     def _write_to_stdout(self, msg: str) -> None:
-        try:
-            from tqdm import tqdm
-
-            tqdm.write(msg, end="")
-        except ImportError:
+        tqdm_write = _get_tqdm_write()
+        if tqdm_write is not None:
+            tqdm_write(msg, end="")
+        else:
             self.stdout.write(msg)
             self.stdout.flush()
 
@@ -134,13 +142,8 @@ class Logger(logging.Logger):
 
 def get_logger(name: Optional[str] = None, display_name: str = "githooklib") -> Logger:
     if name is None:
-        import inspect
-
-        frame = inspect.currentframe()
-        if frame and frame.f_back:
-            name = frame.f_back.f_globals.get("__name__", "githooklib")
-        else:
-            name = "githooklib"
+        caller = sys._getframe(1)  # pylint: disable=protected-access
+        name = caller.f_globals.get("__name__", "githooklib")
 
     manager = logging.Logger.manager
     if name in manager.loggerDict:
@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Optional
 
 from ..logger import get_logger
 from ..ui_messages import (
@@ -12,27 +13,12 @@ logger = get_logger()
 
 
 class ErrorMessageService:
+    __slots__ = ("hook_discovery_service",)
 
-    @staticmethod
-    def _resolve_search_path(search_path: str, cwd: Path) -> Path:
-        if Path(search_path).is_absolute():
-            return Path(search_path)
-        return cwd / search_path
-
-    @staticmethod
-    def _add_search_dir_info(error_lines: list[str], search_dir: Path) -> None:
-        if not search_dir.exists() or not search_dir.is_dir():
-            error_lines.append(f"  - {search_dir} (directory does not exist)")
-            return
-
-        py_files = [f for f in search_dir.glob("*.py") if f.name != "__init__.py"]
-        if py_files:
-            error_lines.append(f"  - {search_dir} (found {len(py_files)} .py files)")
-        else:
-            error_lines.append(f"  - {search_dir} (no .py files found)")
-
-    def __init__(self) -> None:
-        self.hook_discovery_service = HookDiscoveryService()
+    def __init__(
+        self, hook_discovery_service: Optional[HookDiscoveryService] = None
+    ) -> None:
+        self.hook_discovery_service = hook_discovery_service or HookDiscoveryService()
 
     def get_hook_not_found_error_message(self, hook_name: str) -> str:
         error_lines = [
@@ -51,20 +37,28 @@ class ErrorMessageService:
         if not project_root:
             return
 
-        root_hooks = list(project_root.glob("*_hook.py"))
-        if root_hooks:
+        root_hook_count = self.hook_discovery_service.count_hook_files(
+            project_root, "_hook.py"
+        )
+        if root_hook_count:
             error_lines.append(
-                f"  - {project_root} (found {len(root_hooks)} *_hook.py files)"
+                f"  - {project_root} (found {root_hook_count} *_hook.py files)"
             )
         else:
             error_lines.append(f"  - {project_root} (no *_hook.py files found)")
 
     def _add_hook_search_paths_info(self, error_lines: list[str]) -> None:
-        cwd = Path.cwd()
-        hook_search_paths = self.hook_discovery_service.hook_search_paths
-        for search_path in hook_search_paths:
-            search_dir = self._resolve_search_path(search_path, cwd)
+        for search_dir in self.hook_discovery_service.get_search_dirs():
             self._add_search_dir_info(error_lines, search_dir)
 
+    def _add_search_dir_info(self, error_lines: list[str], search_dir: Path) -> None:
+        py_file_count = self.hook_discovery_service.count_hook_files(search_dir, ".py")
+        if py_file_count is None:
+            error_lines.append(f"  - {search_dir} (directory does not exist)")
+        elif py_file_count:
+            error_lines.append(f"  - {search_dir} (found {py_file_count} .py files)")
+        else:
+            error_lines.append(f"  - {search_dir} (no .py files found)")
+
 
 __all__ = ["ErrorMessageService"]
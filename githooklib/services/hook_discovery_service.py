@@ -1,6 +1,9 @@
-from collections import defaultdict
+import inspect
+import os
+import sys
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping, Optional, Sequence, Union
 
 from ..constants import DEFAULT_HOOK_SEARCH_DIR
 from ..git_hook import GitHook
@@ -10,71 +13,132 @@ from ..logger import get_logger
 
 logger = get_logger()
 
+DiscoveryCacheKey = tuple[Path, tuple[Path, ...]]
+DiscoveryResult = tuple[Mapping[str, type[GitHook]], tuple[str, ...]]
+_DISCOVERY_CACHE: dict[DiscoveryCacheKey, DiscoveryResult] = {}
+
 
 class HookDiscoveryService:
+    __slots__ = (
+        "project_root",
+        "hook_search_paths",
+        "_search_dirs",
+        "module_import_gateway",
+        "_scanned_files",
+    )
+
     DEFAULT_HOOK_SEARCH_DIR = "githooks"
 
     @staticmethod
-    def _collect_hook_classes_by_name() -> dict[str, list[type[GitHook]]]:
-        hook_classes_by_name: dict[str, list[type[GitHook]]] = defaultdict(list)
-        registered_hooks = GitHook.get_registered_hooks()
-        for hook_class in registered_hooks:
-            try:
-                instance = hook_class()
-            except Exception as e:
-                logger.error(
-                    "Failed to instantiate hook class %s: %s", hook_class.__name__, e
-                )
-                continue
-            hook_name = instance.get_hook_name()
-            hook_classes_by_name[hook_name].append(hook_class)
-        return dict(hook_classes_by_name)
+    def _scan_python_files(directory: Path, suffix: str) -> list[Path]:
+        try:
+            with os.scandir(directory) as entries:
+                return [
+                    Path(entry.path)
+                    for entry in entries
+                    if entry.name.endswith(suffix)
+                    and not entry.name.startswith("_")
+                    and entry.is_file()
+                ]
+        except OSError as e:
+            logger.trace("Skipping unreadable directory %s: %s", directory, e)
+            return []
 
     def __init__(self) -> None:
         self.project_root = ProjectRootGateway.find_project_root()
-        self.hook_search_paths = [DEFAULT_HOOK_SEARCH_DIR]
+        self.hook_search_paths = [Path(DEFAULT_HOOK_SEARCH_DIR)]
+        self._search_dirs = self._join_search_dirs()
         self.module_import_gateway = ModuleImportGateway()
-        self._hooks: Optional[dict[str, type[GitHook]]] = None
+        self._scanned_files: dict[tuple[Path, str], list[Path]] = {}
 
-    def discover_hooks(self) -> dict[str, type[GitHook]]:
-        if self._hooks is not None:
-            return self._hooks
+    def discover_hooks(self) -> Mapping[str, type[GitHook]]:
         if not self.project_root:
-            return {}
+            return MappingProxyType({})
+        return self._get_discovery_result()[0]
 
+    def get_hook_names(self) -> tuple[str, ...]:
+        if not self.project_root:
+            return ()
+        return self._get_discovery_result()[1]
+
+    def _get_discovery_result(self) -> DiscoveryResult:
+        cache_key = self._get_discovery_cache_key()
+        result = _DISCOVERY_CACHE.get(cache_key)
+        if result is None:
+            self._scanned_files.clear()
+            hooks = self._discover_hooks_uncached()
+            result = hooks, tuple(sorted(hooks))
+            _DISCOVERY_CACHE[cache_key] = result
+        return result
+
+    def _get_discovery_cache_key(self) -> DiscoveryCacheKey:
+        return self.project_root, self._search_dirs
+
+    def _discover_hooks_uncached(self) -> Mapping[str, type[GitHook]]:
         self._import_all_hook_modules()
-        hook_classes_by_name = self._collect_hook_classes_by_name()
-        self._validate_no_duplicate_hooks(hook_classes_by_name)
-        hooks = {name: classes[0] for name, classes in hook_classes_by_name.items()}
-        self._hooks = hooks
-        return hooks
+        hooks, duplicates = self._collect_hook_classes()
+        self._validate_no_duplicate_hooks(duplicates)
+        return MappingProxyType(hooks)
+
+    @staticmethod
+    def _collect_hook_classes() -> (
+        tuple[dict[str, type[GitHook]], dict[str, list[type[GitHook]]]]
+    ):
+        hooks: dict[str, type[GitHook]] = {}
+        duplicates: dict[str, list[type[GitHook]]] = {}
+        for hook_class in GitHook.get_registered_hooks():
+            if inspect.isabstract(hook_class):
+                logger.trace("Skipping abstract hook class %s", hook_class.__name__)
+                continue
+            hook_name = sys.intern(hook_class.get_hook_name())
+            existing = hooks.setdefault(hook_name, hook_class)
+            if existing is not hook_class:
+                duplicates.setdefault(hook_name, [existing]).append(hook_class)
+        return hooks, duplicates
 
     def find_hook_modules(self) -> list[Path]:
         hook_modules = []
 
         if self.project_root:
-            for py_file in self.project_root.glob("*_hook.py"):
-                hook_modules.append(py_file)
+            hook_modules.extend(self._scan_hook_files(self.project_root, "_hook.py"))
+
+        for search_dir in self.get_search_dirs():
+            if os.path.isdir(search_dir):
+                hook_modules.extend(self._scan_hook_files(search_dir, ".py"))
 
-        cwd = Path.cwd()
-        for search_path in self.hook_search_paths:
-            if Path(search_path).is_absolute():
-                search_dir = Path(search_path)
-            else:
-                search_dir = cwd / search_path
+        return list(dict.fromkeys(hook_modules))
 
-            if search_dir.exists() and search_dir.is_dir():
-                for py_file in search_dir.glob("*.py"):
-                    if py_file.name != "__init__.py":
-                        hook_modules.append(py_file)
+    def count_hook_files(self, directory: Path, suffix: str) -> Optional[int]:
+        if not os.path.isdir(directory):
+            return None
+        return len(self._scan_hook_files(directory, suffix))
 
-        return hook_modules
+    def _scan_hook_files(self, directory: Path, suffix: str) -> list[Path]:
+        key = (directory, suffix)
+        files = self._scanned_files.get(key)
+        if files is None:
+            files = self._scan_python_files(directory, suffix)
+            self._scanned_files[key] = files
+        return files
 
-    def invalidate_cache(self) -> None:
-        self._hooks = None
+    def get_search_dirs(self) -> tuple[Path, ...]:
+        return self._search_dirs
 
-    def set_hook_search_paths(self, hook_search_paths: list[str]) -> None:
-        self.hook_search_paths = hook_search_paths
+    def _join_search_dirs(self) -> tuple[Path, ...]:
+        cwd = Path(os.getcwd())
+        return tuple(cwd / search_path for search_path in self.hook_search_paths)
+
+    @staticmethod
+    def invalidate_cache() -> None:
+        _DISCOVERY_CACHE.clear()
+
+    def set_hook_search_paths(
+        self, hook_search_paths: Sequence[Union[str, Path]]
+    ) -> None:
+        self.hook_search_paths = [
+            Path(search_path) for search_path in hook_search_paths
+        ]
+        self._search_dirs = self._join_search_dirs()
         self.invalidate_cache()
 
     def hook_exists(self, hook_name: str) -> bool:
@@ -86,13 +150,8 @@ class HookDiscoveryService:
             self.module_import_gateway.import_module(module_path, self.project_root)
 
     def _validate_no_duplicate_hooks(
-        self, hook_classes_by_name: dict[str, list[type[GitHook]]]
+        self, duplicates: dict[str, list[type[GitHook]]]
     ) -> None:
-        duplicates = {
-            name: classes
-            for name, classes in hook_classes_by_name.items()
-            if len(classes) > 1
-        }
         if duplicates:
             logger.error(
                 "Found %d duplicate hook names: %s",
@@ -1,10 +1,12 @@
 import logging
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
 from ..constants import EXIT_FAILURE
 from ..gateways.git_gateway import GitGateway
+from ..git_hook import GitHook
 from ..logger import get_logger
 from .hook_discovery_service import HookDiscoveryService
 
@@ -19,43 +21,48 @@ class InstalledHooksContext:
 
 
 class HookManagementService:
-    def __init__(self) -> None:
-        self.hook_discovery_service = HookDiscoveryService()
+    __slots__ = ("hook_discovery_service", "git_gateway")
+
+    def __init__(
+        self, hook_discovery_service: Optional[HookDiscoveryService] = None
+    ) -> None:
+        self.hook_discovery_service = hook_discovery_service or HookDiscoveryService()
         self.git_gateway = GitGateway()
 
     def list_hooks(self) -> list[str]:
-        hooks = self.hook_discovery_service.discover_hooks()
-        hook_names = sorted(hooks.keys())
-        return hook_names
+        return list(self.hook_discovery_service.get_hook_names())
 
     def install_hook(self, hook_name: str) -> bool:
-        hooks = self.hook_discovery_service.discover_hooks()
-        if hook_name not in hooks:
-            logger.warning("Hook '%s' not found in discovered hooks", hook_name)
+        hook = self._create_hook(hook_name)
+        if hook is None:
             return False
-        hook_class = hooks[hook_name]
-        hook = hook_class()
-        success = hook.install()
-        return success
+        return hook.install()
 
     def uninstall_hook(self, hook_name: str) -> bool:
-        hooks = self.hook_discovery_service.discover_hooks()
-        if hook_name not in hooks:
-            logger.warning("Hook '%s' not found in discovered hooks", hook_name)
+        hook = self._create_hook(hook_name)
+        if hook is None:
             return False
-        hook_class = hooks[hook_name]
-        hook = hook_class()
-        success = hook.uninstall()
-        return success
+        return hook.uninstall()
 
     def run_hook(self, hook_name: str) -> int:
+        hook = self._create_hook(hook_name)
+        if hook is None:
+            return EXIT_FAILURE
+        return hook.run()
+
+    def _create_hook(self, hook_name: str) -> Optional[GitHook]:
         hooks = self.hook_discovery_service.discover_hooks()
         if hook_name not in hooks:
             logger.warning("Hook '%s' not found in discovered hooks", hook_name)
-            return EXIT_FAILURE
+            return None
         hook_class = hooks[hook_name]
-        hook = hook_class()
-        return hook.run()
+        try:
+            return hook_class()
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.error(
+                "Failed to instantiate hook class %s: %s", hook_class.__name__, e
+            )
+            return None
 
     def get_installed_hooks_with_context(self) -> InstalledHooksContext:
         git_root = self.git_gateway.get_git_root_path()
@@ -63,7 +70,7 @@ class HookManagementService:
             return InstalledHooksContext({}, None, False)
 
         hooks_dir = git_root / "hooks"
-        hooks_dir_exists = hooks_dir.exists()
+        hooks_dir_exists = os.path.isdir(hooks_dir)
 
         if not hooks_dir_exists:
             return InstalledHooksContext({}, git_root, False)
@@ -1,3 +1,4 @@
+import os
 import shutil
 from pathlib import Path
 from typing import Optional
@@ -11,29 +12,29 @@ logger = get_logger()
 
 
 class HookSeedingService:
+    __slots__ = ("examples_gateway",)
 
     def __init__(self) -> None:
         self.examples_gateway = SeedGateway()
 
     def get_target_hook_path(self, example_name: str, project_root: Path) -> Path:
-        return project_root / TARGET_HOOKS_DIR / f"{example_name}.py"
+        return project_root.joinpath(TARGET_HOOKS_DIR, f"{example_name}.py")
 
     def does_target_hook_exist(self, example_name: str, project_root: Path) -> bool:
-        return self.get_target_hook_path(example_name, project_root).exists()
+        return os.path.exists(self.get_target_hook_path(example_name, project_root))
 
     def seed_hook(self, example_name: str, project_root: Path) -> bool:
         if not self.examples_gateway.is_example_available(example_name):
             logger.warning("Example '%s' is not available", example_name)
             return False
 
-        if self.does_target_hook_exist(example_name, project_root):
+        target_file = self.get_target_hook_path(example_name, project_root)
+        if os.path.exists(target_file):
             logger.warning("Target hook '%s' already exists", example_name)
             return False
 
         source_file = self.examples_gateway.get_example_path(example_name)
-        target_hooks_dir = project_root / TARGET_HOOKS_DIR
-        target_hooks_dir.mkdir(exist_ok=True)
-        target_file = target_hooks_dir / f"{example_name}.py"
+        target_file.parent.mkdir(exist_ok=True)
 
         shutil.copy2(source_file, target_file)
         logger.info("Successfully seeded hook '%s' to %s", example_name, target_file)
@@ -42,7 +43,8 @@ class HookSeedingService:
     def get_seed_failure_details(
         self, example_name: str, project_root: Optional[Path]
     ) -> SeedFailureDetails:
-        example_not_found = not self.examples_gateway.is_example_available(example_name)
+        available_examples = self.examples_gateway.get_available_examples()
+        example_not_found = example_name not in available_examples
         project_root_not_found = project_root is None
         target_hook_path = (
             self.get_target_hook_path(example_name, project_root)
@@ -50,11 +52,8 @@ class HookSeedingService:
             else None
         )
         target_hook_already_exists = (
-            self.does_target_hook_exist(example_name, project_root)
-            if project_root
-            else False
+            os.path.exists(target_hook_path) if target_hook_path else False
         )
-        available_examples = self.examples_gateway.get_available_examples()
 
         return SeedFailureDetails(
             example_not_found=example_not_found,
@@ -22,3 +22,20 @@ UI_MESSAGE_EXAMPLE_ALREADY_EXISTS_SUFFIX = "' already exists at "
 UI_MESSAGE_FAILED_TO_SEED_EXAMPLE_PREFIX = "Failed to seed example '"
 UI_MESSAGE_FAILED_TO_SEED_EXAMPLE_PROJECT_ROOT_NOT_FOUND = "'. Project root not found."
 UI_MESSAGE_ERROR_SEEDING_EXAMPLE_PREFIX = "Error seeding example: "
+UI_MESSAGE_HELP = """NAME
+    githooklib - Create, manage, and install Git hooks written in Python
+
+SYNOPSIS
+    githooklib COMMAND [ARGS] [--debug | --trace]
+
+COMMANDS
+    install HOOK_NAME...   Install one or more hooks to .git/hooks/
+    list                   List all available hooks in the project
+    run HOOK_NAME          Run a hook manually for testing purposes
+    seed [EXAMPLE_NAME]    Seed an example hook to githooks/ (lists examples if omitted)
+    show                   Show all installed git hooks and their installation source
+    uninstall HOOK_NAME... Uninstall one or more hooks from .git/hooks/
+
+FLAGS
+    -h, --help             Show this message and exit
+    -V, --version          Show the githooklib version and exit"""
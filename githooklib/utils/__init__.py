@@ -1,2 +1,15 @@
-from .google_fire_mock_get_result_function import *
-from .command_result_factory import *
+from typing import TYPE_CHECKING, Dict
+
+from .lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from .command_result_factory import *
+
+_LAZY_EXPORTS: Dict[str, str] = {
+    "CommandResultFactory": ".command_result_factory",
+}
+
+__getattr__, __dir__ = lazy_exports(globals(), _LAZY_EXPORTS)
+
+
+__all__ = [*_LAZY_EXPORTS]
@@ -1,7 +1,7 @@
 import subprocess
 from typing import List
 
-from ..command import CommandResult
+from ..definitions import CommandResult
 from ..constants import EXIT_FAILURE
 
 
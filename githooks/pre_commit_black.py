@@ -7,13 +7,10 @@ from githooklib import get_logger
 logger = get_logger(__name__, "pre-commit")
 
 
-def _black_exists(command_executor: CommandExecutor) -> bool:
-    check_result = command_executor.run(["python", "-m", "black", "--version"])
-    if check_result.exit_code == 127:
-        return False
-    if not check_result.success and "No module named" in check_result.stderr:
-        return False
-    return True
+def _black_missing(result: CommandResult) -> bool:
+    if result.exit_code == 127:
+        return True
+    return not result.success and "No module named" in result.stderr
 
 
 def _get_modified_python_files(command_executor: CommandExecutor) -> list[str]:
@@ -43,16 +40,16 @@ class BlackFormatterPreCommit(GitHook):
         self.stage_changes = stage_changes
 
     def execute(self, context: GitHookContext) -> HookResult:
-        if not _black_exists(self.command_executor):
+        logger.info("Reformatting code with black...")
+        result = self.command_executor.run(["python", "-m", "black", "."])
+
+        if _black_missing(result):
             logger.warning("Black tool not found. Skipping code formatting check.")
             return HookResult(
                 success=True,
                 message="Black tool not found. Check skipped.",
             )
 
-        logger.info("Reformatting code with black...")
-        result = self.command_executor.run(["python", "-m", "black", "."])
-
         if not result.success:
             logger.error("Black formatting failed.")
             if result.stderr:
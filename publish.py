@@ -15,18 +15,19 @@ from quickpub import (
     CondaPythonProvider,
 )
 from tqdm import tqdm
+from githooklib import __version__
 from githooklib.__main__ import main as entry_point
 
 
 def main() -> None:
     publish(
         name="githooklib",
-        version="1.0.0",
+        version=__version__,
         author="danielnachumdev",
         author_email="danielnachumdev@gmail.com",
         description="A Python framework (and CLI) for creating, managing, and installing Git hooks with python",
         min_python=Version(3, 8, 0),
-        dependencies=["fire"],
+        dependencies=[],
         homepage="https://github.com/danielnachumdev/githooklib",
         enforcers=[
             PypircEnforcer(),
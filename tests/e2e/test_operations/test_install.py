@@ -16,6 +16,12 @@ class TestInstallE2E(OperationsBaseTestCase):
             self.assertIn("githooklib", content)
             self.assertIn("run", content)
 
+    def test_install_multiple_hooks(self):
+        with self.new_temp_project() as root:
+            self.githooklib(["install", "pre-commit", "pre-push"], cwd=root)
+            self.verify_hook_installed(root, "pre-commit")
+            self.verify_hook_installed(root, "pre-push")
+
     def test_hook_not_found(self):
         with self.new_temp_project() as root:
             result = self.githooklib(
@@ -19,6 +19,13 @@ class TestUninstallE2E(OperationsBaseTestCase):
                 f"pre-commit should not appear in show output: {show_output}",
             )
 
+    def test_uninstall_multiple_hooks(self):
+        with self.new_temp_project() as root:
+            self.githooklib(["install", "pre-commit", "pre-push"], cwd=root)
+            self.githooklib(["uninstall", "pre-commit", "pre-push"], cwd=root)
+            self.verify_hook_uninstalled(root, "pre-commit")
+            self.verify_hook_uninstalled(root, "pre-push")
+
     def test_hook_not_found(self):
         with self.new_temp_project() as root:
             result = self.githooklib(
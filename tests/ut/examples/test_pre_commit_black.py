@@ -1,6 +1,7 @@
 import tempfile
 from contextlib import contextmanager
 from pathlib import Path
+from unittest.mock import patch
 
 from githooklib import GitHookContext
 from githooklib.command import CommandExecutor, CommandResult
@@ -51,6 +52,28 @@ class TestPreCommitBlack(BaseTestCase):
                 staged_after_hook, [staged_file.name, unstaged_file.name]
             )
 
+    def test_missing_black_skips_check(self) -> None:
+        missing_results = {
+            "command_not_found": CommandResult(
+                False, 127, "", "Command not found", ["black", "."]
+            ),
+            "module_not_found": CommandResult(
+                False, 1, "", "No module named black", ["python", "-m", "black"]
+            ),
+        }
+        for name, missing_result in missing_results.items():
+            with self.subTest(name):
+                hook = BlackFormatterPreCommit()
+                with patch.object(
+                    hook.command_executor, "python_module", return_value=missing_result
+                ), patch.object(hook.command_executor, "run") as mock_run:
+                    result = hook.execute(GitHookContext("pre-commit", []))
+
+                self.assertTrue(result.success)
+                self.assertEqual("Black tool not found. Check skipped.", result.message)
+                self.assertEqual(0, result.exit_code)
+                mock_run.assert_not_called()
+
     def _initialize_repo(self, repo: Path) -> None:
         self._git(repo, ["init"])
         self._git(repo, ["config", "user.email", "test@example.com"])
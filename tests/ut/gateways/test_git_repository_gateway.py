@@ -11,8 +11,12 @@ from tests.base_test_case import BaseTestCase
 
 class TestGitRepositoryGateway(BaseTestCase):
     def setUp(self):
+        GitGateway.clear_git_root_cache()
         self.gateway = GitGateway()
 
+    def tearDown(self):
+        GitGateway.clear_git_root_cache()
+
     def test_find_git_root_via_command_subprocess_fails_returns_none(self):
         with self.subTest("file_not_found_error"):
             with patch("subprocess.run", side_effect=FileNotFoundError()):
@@ -68,7 +72,6 @@ class TestGitRepositoryGateway(BaseTestCase):
         self.assertTrue(result.exists())
 
     def test_find_git_root_no_repo_returns_none(self):
-        GitGateway.get_git_root_path.cache_clear()
         with tempfile.TemporaryDirectory() as temp_dir:
             original_cwd = os.getcwd()
             try:
@@ -85,7 +88,54 @@ class TestGitRepositoryGateway(BaseTestCase):
                         self.assertIsNone(result)
             finally:
                 os.chdir(original_cwd)
-                GitGateway.get_git_root_path.cache_clear()
+
+    def test_find_git_root_prefers_filesystem_walk(self):
+        with patch.dict(os.environ), patch(
+            "githooklib.gateways.git_gateway.GitGateway._find_git_root_via_command"
+        ) as mock_command:
+            os.environ.pop("GIT_DIR", None)
+            result = GitGateway.get_git_root_path()
+            result = self.unwrap_optional(result)
+            mock_command.assert_not_called()
+            self.assertEqual(".git", result.name)
+            self.assertTrue(result.exists())
+
+    def test_git_root_cache_follows_cwd(self):
+        original_root = self.unwrap_optional(GitGateway.get_git_root_path())
+        with tempfile.TemporaryDirectory() as temp_dir:
+            (Path(temp_dir) / ".git").mkdir()
+            original_cwd = os.getcwd()
+            try:
+                os.chdir(temp_dir)
+                with patch.dict(os.environ):
+                    os.environ.pop("GIT_DIR", None)
+                    result = self.unwrap_optional(GitGateway.get_git_root_path())
+                self.assertEqual(Path(temp_dir).resolve() / ".git", result)
+            finally:
+                os.chdir(original_cwd)
+        self.assertEqual(original_root, GitGateway.get_git_root_path())
+
+    def test_git_root_cache_covers_walked_ancestors(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir).resolve()
+            (root / ".git").mkdir()
+            nested = root / "a" / "b"
+            nested.mkdir(parents=True)
+            original_cwd = os.getcwd()
+            try:
+                with patch.dict(os.environ):
+                    os.environ.pop("GIT_DIR", None)
+                    os.chdir(nested)
+                    self.assertEqual(root / ".git", GitGateway.get_git_root_path())
+                    os.chdir(root / "a")
+                    with patch.object(
+                        GitGateway, "_find_git_root_via_filesystem"
+                    ) as mock_walk:
+                        result = GitGateway.get_git_root_path()
+                        mock_walk.assert_not_called()
+                    self.assertEqual(root / ".git", result)
+            finally:
+                os.chdir(original_cwd)
 
     def test_is_hook_from_githooklib_true_for_correct(self):
         with tempfile.NamedTemporaryFile(
@@ -185,11 +235,21 @@ if __name__ == "__main__":
                 self.assertIn("pre-push", result)
                 self.assertFalse(result["pre-push"])
                 self.assertNotIn("pre-commit.sample", result)
+                self.assertEqual(["pre-commit", "pre-push"], list(result))
             finally:
                 for hook_file in [githooklib_hook, regular_hook, sample_hook]:
                     if hook_file.exists():
                         hook_file.unlink()
 
+    def test_get_installed_hooks_notices_rewritten_hook(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            hooks_dir = Path(temp_dir)
+            hook = hooks_dir / "pre-push"
+            hook.write_text("#!/bin/bash\necho 'test'")
+            self.assertFalse(self.gateway.get_installed_hooks(hooks_dir)["pre-push"])
+            hook.write_text("python -m githooklib run pre-push")
+            self.assertTrue(self.gateway.get_installed_hooks(hooks_dir)["pre-push"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -12,6 +12,7 @@ class TestModuleImportGateway(BaseTestCase):
     def setUp(self):
         self.gateway = ModuleImportGateway()
         self.original_sys_path = sys.path.copy()
+        ModuleImportGateway._find_module_origin.cache_clear()
 
     def tearDown(self):
         sys.path[:] = self.original_sys_path
@@ -115,12 +116,45 @@ class TestModuleImportGateway(BaseTestCase):
                 mock_import.assert_called_once_with("test.module.__init__")
 
     def test_import_absolute_module(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            module_file = Path(temp_dir) / "absolute_test_module.py"
+            module_file.write_text("VALUE = 42\n")
+            with patch.dict(sys.modules):
+                self.gateway._import_absolute_module(module_file)
+                self.assertEqual(42, sys.modules["absolute_test_module"].VALUE)
+
+    def test_import_absolute_module_can_import_sibling_package(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            hooks_dir = Path(temp_dir)
+            helpers_dir = hooks_dir / "sibling_helpers"
+            helpers_dir.mkdir()
+            (helpers_dir / "__init__.py").write_text("VALUE = 7\n")
+            module_file = hooks_dir / "sibling_hook_module.py"
+            module_file.write_text("from sibling_helpers import VALUE\n")
+            with patch.dict(sys.modules):
+                self.gateway._import_absolute_module(module_file)
+                self.assertEqual(7, sys.modules["sibling_hook_module"].VALUE)
+            self.assertEqual(1, sys.path.count(str(hooks_dir)))
+
+    def test_import_absolute_module_failure_leaves_no_module_behind(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            module_file = Path(temp_dir) / "broken_test_module.py"
+            module_file.write_text("raise RuntimeError('boom')\n")
+            with self.assertRaises(RuntimeError):
+                self.gateway._import_absolute_module(module_file)
+            self.assertNotIn("broken_test_module", sys.modules)
+
+    def test_import_absolute_module_skips_already_imported_module(self):
         with tempfile.TemporaryDirectory() as temp_dir:
             module_file = Path(temp_dir) / "test_module.py"
             module_file.write_text("")
-            with patch("builtins.__import__") as mock_import:
+            with patch.dict(sys.modules, {"test_module": MagicMock()}), patch(
+                "builtins.__import__"
+            ) as mock_import:
                 self.gateway._import_absolute_module(module_file)
-                mock_import.assert_called_once_with("test_module")
+                imported = [c.args[0] for c in mock_import.call_args_list]
+                self.assertNotIn("test_module", imported)
+                self.assertNotIn(temp_dir, sys.path)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,139 @@
+import tempfile
+import unittest
+from pathlib import Path
+from typing import Tuple
+from unittest.mock import patch
+
+from githooklib.api import API
+from githooklib.services import ErrorMessageService
+from githooklib.services import hook_discovery_service
+from githooklib.services.hook_discovery_service import HookDiscoveryService
+from tests.base_test_case import BaseTestCase
+
+
+class FakePreCommitHook:
+    @classmethod
+    def get_hook_name(cls) -> str:
+        return "pre-commit"
+
+
+class FakePrePushHook:
+    @classmethod
+    def get_hook_name(cls) -> str:
+        return "pre-push"
+
+
+class TestHookDiscoveryService(BaseTestCase):
+    def setUp(self):
+        HookDiscoveryService.invalidate_cache()
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.project_root = Path(temp_dir.name)
+        self.registered_hooks: Tuple[type, ...] = (FakePreCommitHook,)
+        patchers = [
+            patch.object(
+                hook_discovery_service.ProjectRootGateway,
+                "find_project_root",
+                return_value=self.project_root,
+            ),
+            patch.object(
+                hook_discovery_service.GitHook,
+                "get_registered_hooks",
+                side_effect=lambda: self.registered_hooks,
+            ),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        scan_patcher = patch.object(HookDiscoveryService, "_import_all_hook_modules")
+        self.mock_scan = scan_patcher.start()
+        self.addCleanup(scan_patcher.stop)
+
+    def tearDown(self):
+        HookDiscoveryService.invalidate_cache()
+
+    def test_instances_share_one_scan(self):
+        first = HookDiscoveryService()
+        second = HookDiscoveryService()
+        self.assertEqual(["pre-commit"], list(first.discover_hooks()))
+        self.assertEqual(("pre-commit",), second.get_hook_names())
+        self.assertIs(first.discover_hooks(), second.discover_hooks())
+        self.assertEqual(1, self.mock_scan.call_count)
+
+    def test_invalidate_cache_rescans_every_instance(self):
+        first = HookDiscoveryService()
+        second = HookDiscoveryService()
+        first.discover_hooks()
+        second.discover_hooks()
+        self.registered_hooks = (FakePreCommitHook, FakePrePushHook)
+
+        first.invalidate_cache()
+
+        self.assertEqual(("pre-commit", "pre-push"), first.get_hook_names())
+        self.assertEqual(("pre-commit", "pre-push"), second.get_hook_names())
+        self.assertEqual(2, self.mock_scan.call_count)
+
+    def test_set_hook_search_paths_rescans_every_instance(self):
+        first = HookDiscoveryService()
+        second = HookDiscoveryService()
+        first.discover_hooks()
+        second.discover_hooks()
+        self.registered_hooks = (FakePreCommitHook, FakePrePushHook)
+
+        first.set_hook_search_paths(["other_hooks"])
+
+        self.assertEqual(("pre-commit", "pre-push"), first.get_hook_names())
+        self.assertEqual(("pre-commit", "pre-push"), second.get_hook_names())
+        self.assertEqual(3, self.mock_scan.call_count)
+
+    def test_discovered_hooks_are_read_only(self):
+        hooks = HookDiscoveryService().discover_hooks()
+        with self.assertRaises(TypeError):
+            hooks["pre-push"] = FakePrePushHook  # type: ignore[index]
+        with self.assertRaises(TypeError):
+            del hooks["pre-commit"]  # type: ignore[attr-defined]
+        self.assertEqual(["pre-commit"], list(HookDiscoveryService().discover_hooks()))
+
+    def test_api_discover_all_hooks_returns_mutable_copy(self):
+        hooks = API().discover_all_hooks()
+        self.assertIsInstance(hooks, dict)
+        hooks["pre-push"] = FakePrePushHook  # type: ignore[assignment]
+        self.assertEqual(["pre-commit"], list(API().discover_all_hooks()))
+        self.assertEqual(1, self.mock_scan.call_count)
+
+    def test_unreadable_directories_count_as_empty(self):
+        hooks_dir = self.project_root / "githooks"
+        hooks_dir.mkdir()
+        (hooks_dir / "pre_commit.py").write_text("")
+        service = HookDiscoveryService()
+        service.set_hook_search_paths([hooks_dir])
+        with patch(
+            "githooklib.services.hook_discovery_service.os.scandir",
+            side_effect=PermissionError("denied"),
+        ):
+            self.assertEqual([], service.find_hook_modules())
+            self.assertEqual(0, service.count_hook_files(hooks_dir, ".py"))
+            self.assertEqual(0, service.count_hook_files(self.project_root, "_hook.py"))
+
+    def test_missing_directory_count_is_none(self):
+        service = HookDiscoveryService()
+        self.assertIsNone(
+            service.count_hook_files(self.project_root / "missing", ".py")
+        )
+
+    def test_not_found_message_survives_unreadable_directory(self):
+        hooks_dir = self.project_root / "githooks"
+        hooks_dir.mkdir()
+        service = HookDiscoveryService()
+        service.set_hook_search_paths([hooks_dir])
+        error_message_service = ErrorMessageService(service)
+        with patch(
+            "githooklib.services.hook_discovery_service.os.scandir",
+            side_effect=PermissionError("denied"),
+        ):
+            message = error_message_service.get_hook_not_found_error_message("nope")
+        self.assertIn(f"{hooks_dir} (no .py files found)", message)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+import io
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from typing import Any, List, Optional, Tuple
+
+from githooklib.cli import _dispatch, _parse_arguments
+
+from tests.base_test_case import BaseTestCase
+
+
+class RecordingCLI:
+    def __init__(self) -> None:
+        self.calls: List[Any] = []
+
+    def seed(self, example_name: Optional[str] = None) -> int:
+        """Seed an example hook."""
+        self.calls.append(("seed", example_name))
+        return 0
+
+    def install(self, hook_name: str, *hook_names: str) -> int:
+        self.calls.append(("install", (hook_name, *hook_names)))
+        return 0
+
+    def run(self, hook_name: str, mode: str = "normal") -> int:
+        self.calls.append(("run", hook_name, mode))
+        return 7
+
+    def list(self) -> None:
+        self.calls.append(("list",))
+
+
+class TestParseArguments(BaseTestCase):
+    def test_parse_arguments(self):
+        test_cases = [
+            ("positional_only", ["a", "b"], (["a", "b"], {})),
+            ("equals_form", ["--name=value"], ([], {"name": "value"})),
+            ("separate_value", ["--name", "value"], ([], {"name": "value"})),
+            (
+                "dashes_become_underscores",
+                ["--example-name", "x"],
+                ([], {"example_name": "x"}),
+            ),
+            (
+                "mixed",
+                ["a", "--name=value", "b", "--other", "c"],
+                (["a", "b"], {"name": "value", "other": "c"}),
+            ),
+            ("trailing_flag", ["--name"], ([], {"name": ""})),
+        ]
+        for test_name, args, expected in test_cases:
+            with self.subTest(test_name=test_name):
+                self.assertEqual(expected, _parse_arguments(args))
+
+
+class TestDispatch(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.cli = RecordingCLI()
+
+    def _dispatch(self, args: List[str]) -> Tuple[int, str, str]:
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            code = _dispatch(self.cli, args)
+        return code, stdout.getvalue(), stderr.getvalue()
+
+    def test_keyword_forms_reach_the_handler(self):
+        for args in (
+            ["seed", "--example-name=black"],
+            ["seed", "--example_name", "black"],
+        ):
+            with self.subTest(args=args):
+                self.cli.calls.clear()
+                code, _, _ = self._dispatch(args)
+                self.assertEqual(0, code)
+                self.assertEqual([("seed", "black")], self.cli.calls)
+
+    def test_positional_and_keyword_arguments_mix(self):
+        code, _, _ = self._dispatch(["run", "--mode", "fast", "pre-commit"])
+        self.assertEqual(7, code)
+        self.assertEqual([("run", "pre-commit", "fast")], self.cli.calls)
+
+    def test_varargs_receive_every_positional(self):
+        code, _, _ = self._dispatch(["install", "pre-commit", "pre-push"])
+        self.assertEqual(0, code)
+        self.assertEqual([("install", ("pre-commit", "pre-push"))], self.cli.calls)
+
+    def test_none_return_maps_to_success(self):
+        code, _, _ = self._dispatch(["list"])
+        self.assertEqual(0, code)
+
+    def test_failed_bind_exits_with_usage_error(self):
+        test_cases = [
+            ("missing_argument", ["run"]),
+            ("unexpected_keyword", ["seed", "--bogus", "x"]),
+            ("too_many_positionals", ["list", "extra"]),
+        ]
+        for test_name, args in test_cases:
+            with self.subTest(test_name=test_name):
+                self.cli.calls.clear()
+                code, _, stderr = self._dispatch(args)
+                self.assertEqual(2, code)
+                self.assertTrue(stderr.startswith(f"{args[0]}: "))
+                self.assertEqual([], self.cli.calls)
+
+    def test_private_attributes_are_not_commands(self):
+        code, _, stderr = self._dispatch(["__init__"])
+        self.assertEqual(2, code)
+        self.assertIn("Unknown command '__init__'", stderr)
+
+    def test_command_help_prints_docstring(self):
+        code, stdout, _ = self._dispatch(["seed", "--help"])
+        self.assertEqual(0, code)
+        self.assertEqual("Seed an example hook.", stdout.strip())
+        self.assertEqual([], self.cli.calls)
+
+
+if __name__ == "__main__":
+    unittest.main()
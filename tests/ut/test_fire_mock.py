@@ -8,6 +8,7 @@ from unittest.mock import patch
 
 from githooklib.__main__ import main
 from githooklib.gateways.project_root_gateway import ProjectRootGateway
+from githooklib.constants import VERSION
 from githooklib.ui_messages import UI_MESSAGE_STARTUP_INFO
 
 from tests.base_test_case import BaseTestCase
@@ -17,11 +18,6 @@ HELP_PATTERN = re.compile(
     re.DOTALL | re.IGNORECASE,
 )
 
-HELP_LONG_FLAG_PATTERN = re.compile(
-    r"INFO:.*?NAME.*?SYNOPSIS",
-    re.DOTALL | re.IGNORECASE,
-)
-
 
 class MockSystemExit(Exception):
     def __init__(self, code: int) -> None:
@@ -106,13 +102,11 @@ class TestFireMock(BaseTestCase):
     def test_help_output(self):
         test_cases = [
             ("no_args", [], HELP_PATTERN, lambda a, b: a),
-            ("short_flag", ["-h"], HELP_LONG_FLAG_PATTERN, lambda a, b: b),
-            (
-                "long_flag",
-                ["--help"],
-                HELP_LONG_FLAG_PATTERN,
-                lambda a, b: b,
-            ),
+            ("short_flag", ["-h"], HELP_PATTERN, lambda a, b: a),
+            ("long_flag", ["--help"], HELP_PATTERN, lambda a, b: a),
+            ("debug_long_flag", ["--debug", "--help"], HELP_PATTERN, lambda a, b: a),
+            ("debug_short_flag", ["--debug", "-h"], HELP_PATTERN, lambda a, b: a),
+            ("trace_long_flag", ["--trace", "--help"], HELP_PATTERN, lambda a, b: a),
         ]
         for test_name, args, pattern, selector in test_cases:
             with self.subTest(test_name=test_name):
@@ -121,6 +115,18 @@ class TestFireMock(BaseTestCase):
                 self.assertRegex(output, pattern)
                 self.assertEqual(0, exit_code)
 
+    def test_version_output(self):
+        for args in (
+            ["-V"],
+            ["--version"],
+            ["--trace", "--version"],
+            ["--debug", "-V"],
+        ):
+            with self.subTest(args=args):
+                exit_code, stdout, stderr = self.runner.run_module_command(args)
+                self.assertEqual(VERSION, stdout.strip())
+                self.assertEqual(0, exit_code)
+
     def test_seed_does_not_print_return_value(self):
         with patch("githooklib.cli.CLI.seed", return_value=42):
             exit_code, stdout, stderr = self.runner.run_module_command(["seed"])
@@ -156,3 +162,14 @@ class TestFireMock(BaseTestCase):
             exit_code, stdout, stderr = self.runner.run_module_command(["list"])
             self.assertIn(UI_MESSAGE_STARTUP_INFO, stdout)
             self.assertEqual(0, exit_code)
+
+    def test_unknown_command_exits_with_usage_error(self):
+        exit_code, stdout, stderr = self.runner.run_module_command(["bogus"])
+        self.assertIn("Unknown command 'bogus'", stderr)
+        self.assertRegex(stderr, HELP_PATTERN)
+        self.assertEqual(2, exit_code)
+
+    def test_missing_argument_exits_with_usage_error(self):
+        exit_code, stdout, stderr = self.runner.run_module_command(["run"])
+        self.assertIn("run: missing a required argument", stderr)
+        self.assertEqual(2, exit_code)
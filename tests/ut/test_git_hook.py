@@ -0,0 +1,40 @@
+import unittest
+
+from githooklib import GitHook, GitHookContext, HookResult
+from tests.base_test_case import BaseTestCase
+
+
+class TestGitHookLogger(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self._registered_hooks = GitHook._registered_hooks
+
+    def tearDown(self):
+        GitHook._registered_hooks = self._registered_hooks
+
+    def test_subclass_gets_its_own_logger_after_base_materialised(self):
+        class BaseHook(GitHook):
+            @classmethod
+            def get_hook_name(cls) -> str:
+                return "pre-commit"
+
+            def execute(self, context: GitHookContext) -> HookResult:
+                return HookResult(success=True)
+
+        class SubHook(BaseHook):
+            @classmethod
+            def get_hook_name(cls) -> str:
+                return "pre-push"
+
+        base_logger = BaseHook.logger
+        sub_logger = SubHook.logger
+
+        self.assertIsNot(base_logger, sub_logger)
+        self.assertEqual("pre-commit", base_logger.display_name)
+        self.assertEqual("pre-push", sub_logger.display_name)
+        self.assertIs(base_logger, BaseHook.logger)
+        self.assertIs(sub_logger, SubHook().logger)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import os
+import shutil
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+from typing import Optional
+
+from tests.base_test_case import BaseTestCase
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+PY38_IMPORTS = [
+    "import githooklib",
+    "from githooklib import GitHook, GitHookContext, HookResult, get_logger",
+    "from githooklib.git_hook import GitHook",
+    "from githooklib.command import CommandExecutor",
+    "import githooklib.gateways",
+    "import githooklib.utils",
+]
+
+
+def _find_python38() -> Optional[str]:
+    if sys.version_info[:2] == (3, 8):
+        return sys.executable
+    executable = shutil.which("python3.8")
+    if executable is None:
+        return None
+    probe = subprocess.run([executable, "-c", "pass"], capture_output=True, check=False)
+    return executable if probe.returncode == 0 else None
+
+
+class TestPython38Imports(BaseTestCase):
+    def test_public_modules_import_on_python38(self) -> None:
+        python38 = _find_python38()
+        if python38 is None:
+            self.skipTest("Python 3.8 is not available")
+
+        env = dict(os.environ, PYTHONPATH=str(PROJECT_ROOT))
+        for statement in PY38_IMPORTS:
+            with self.subTest(statement):
+                result = subprocess.run(
+                    [python38, "-c", statement],
+                    capture_output=True,
+                    text=True,
+                    env=env,
+                    check=False,
+                )
+                self.assertEqual(0, result.returncode, result.stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()